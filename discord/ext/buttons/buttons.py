@@ -1,12 +1,15 @@
 import asyncio
 import discord
-import inspect
+import math
 from discord.ext import commands
 from functools import partial
+from operator import itemgetter
 from typing import Union
 
 __all__ = ('Session', 'Paginator', 'button', 'inverse_button',)
 
+_START, _STOP, _END, _FORWARD, _BACK = range(5)
+
 
 class Button:
     __slots__ = ('_callback', '_inverse_callback', 'emoji', 'position', 'try_remove')
@@ -29,34 +32,53 @@ class Session:
         A bool indicating whether or not the session should try to remove reactions after they have been pressed.
     """
 
+    __buttons__ = {}
+
     def __init__(self, *, timeout: int = 180, try_remove: bool = True):
-        self._buttons = {}
-        self._gather_buttons()
+        self._buttons = dict(self.__buttons__)
 
         self.page: discord.Message = None
         self._session_task = None
+        self._reaction_task = None
+        self._pending_removals = set()
         self._cancelled = False
         self._try_remove = try_remove
+        self._emoji_cache = {}
 
         self.timeout = timeout
         self.buttons = self._buttons
+        self._button_keys = frozenset()
 
         self._defaults = {}
         self._default_stop = {}
+        self._default_buttons = frozenset()
+        self._default_stop_buttons = frozenset()
 
     def __init_subclass__(cls, **kwargs):
-        pass
+        super().__init_subclass__(**kwargs)
+        cls.__buttons__ = cls._gather_buttons()
+
+    @classmethod
+    def _gather_buttons(cls):
+        buttons = {}
+        seen = set()
+
+        for klass in cls.__mro__:
+            for name, member in klass.__dict__.items():
+                if name in seen:
+                    continue
+                seen.add(name)
+
+                if not getattr(member, '__is_button__', False):
+                    continue
 
-    def _gather_buttons(self):
-        for _, member in inspect.getmembers(self):
-            if hasattr(member, '__button__'):
                 button = member.__button__
 
-                sorted_ = self.sort_buttons(buttons=self._buttons)
+                sorted_ = cls._sort_buttons(buttons)
                 try:
                     button_ = sorted_[button.emoji]
                 except KeyError:
-                    self._buttons[button.position, button.emoji] = button
+                    buttons[button.position, button.emoji] = button
                     continue
 
                 if button._inverse_callback:
@@ -64,13 +86,19 @@ class Session:
                 else:
                     button_._callback = button._callback
 
-                self._buttons[button.position, button.emoji] = button_
+                buttons[button.position, button.emoji] = button_
+
+        return buttons
+
+    @staticmethod
+    def _sort_buttons(buttons: dict):
+        return {k[1]: v for k, v in sorted(buttons.items(), key=itemgetter(0))}
 
     def sort_buttons(self, *, buttons: dict = None):
         if buttons is None:
             buttons = self._buttons
 
-        return {k[1]: v for k, v in sorted(buttons.items(), key=lambda t: t[0])}
+        return self._sort_buttons(buttons)
 
     async def start(self, ctx, page=None):
         """Start the session with the given page.
@@ -91,19 +119,27 @@ class Session:
         else:
             self.page = await ctx.send(page)
 
-        self._session_task = ctx.bot.loop.create_task(self._session(ctx))
+        self._session_task = asyncio.ensure_future(self._session(ctx))
 
     async def _session(self, ctx):
         self.buttons = self.sort_buttons()
+        self._button_keys = frozenset(self.buttons)
 
-        ctx.bot.loop.create_task(self._add_reactions(self.buttons.keys()))
+        self._reaction_task = asyncio.ensure_future(self._add_reactions(self.buttons.keys()))
 
         await self._session_loop(ctx)
 
     async def _session_loop(self, ctx):
+        # Skip the check(payload)(ctx) indirection unless a subclass has overridden it.
+        if type(self).check is Session.check:
+            check = partial(self._check, ctx)
+        else:
+            def check(payload):
+                return self.check(payload)(ctx)
+
         while True:
-            _add = asyncio.ensure_future(ctx.bot.wait_for('raw_reaction_add', check=lambda _: self.check(_)(ctx)))
-            _remove = asyncio.ensure_future(ctx.bot.wait_for('raw_reaction_remove', check=lambda _: self.check(_)(ctx)))
+            _add = asyncio.ensure_future(ctx.bot.wait_for('raw_reaction_add', check=check))
+            _remove = asyncio.ensure_future(ctx.bot.wait_for('raw_reaction_remove', check=check))
 
             done, pending = await asyncio.wait(
                 (_add, _remove),
@@ -115,7 +151,7 @@ class Session:
                 future.cancel()
 
             if not done:
-                return ctx.bot.loop.create_task(self.cancel())
+                return asyncio.ensure_future(self.cancel())
 
             try:
                 result = done.pop()
@@ -126,20 +162,23 @@ class Session:
                 else:
                     action = False
             except Exception:
-                return ctx.bot.loop.create_task(self.cancel())
+                return asyncio.ensure_future(self.cancel())
 
             emoji = self.get_emoji_as_string(payload.emoji)
             button = self.buttons[emoji]
 
-            if self._try_remove and button.try_remove:
-                try:
-                    await self.page.remove_reaction(payload.emoji, ctx.guild.get_member(payload.user_id))
-                except discord.HTTPException:
-                    pass
+            # The default check only accepts the author, so avoid the member cache lookup.
+            if payload.user_id == ctx.author.id:
+                member = ctx.author
+            else:
+                member = ctx.guild.get_member(payload.user_id)
 
-            member = ctx.guild.get_member(payload.user_id)
+            if self._try_remove and button.try_remove:
+                task = asyncio.ensure_future(self._remove_reaction(payload.emoji, member))
+                self._pending_removals.add(task)
+                task.add_done_callback(self._pending_removals.discard)
 
-            if action and button in self._defaults.values() or button in self._default_stop.values():
+            if action and button in self._default_buttons or button in self._default_stop_buttons:
                 await button._callback(ctx, member)
             elif action and button._callback:
                 await button._callback(self, ctx, member)
@@ -160,6 +199,12 @@ class Session:
         """Clean the session up."""
         self._session_task.cancel()
 
+        if self._reaction_task:
+            self._reaction_task.cancel()
+
+        for task in self._pending_removals:
+            task.cancel()
+
         try:
             await self.page.delete()
         except discord.NotFound:
@@ -172,23 +217,37 @@ class Session:
             except discord.NotFound:
                 pass
 
+    async def _remove_reaction(self, reaction, member):
+        try:
+            await self.page.remove_reaction(reaction, member)
+        except discord.HTTPException:
+            pass
+
     def get_emoji_as_string(self, emoji):
-        return f'{emoji.name}{":" + str(emoji.id) if emoji.is_custom_emoji() else ""}'
+        key = emoji.id or emoji.name
+
+        try:
+            return self._emoji_cache[key]
+        except KeyError:
+            pass
+
+        string = f'{emoji.name}:{emoji.id}' if emoji.is_custom_emoji() else emoji.name
+        self._emoji_cache[key] = string
+
+        return string
 
     def check(self, payload):
         """Check which takes in a raw_reaction payload. This may be overwritten."""
-        emoji = self.get_emoji_as_string(payload.emoji)
-
-        def inner(ctx):
-            if emoji not in self.buttons.keys():
-                return False
-            elif payload.user_id == ctx.bot.user.id or payload.message_id != self.page.id:
-                return False
-            elif payload.user_id != ctx.author.id:
-                return False
-            return True
+        return partial(self._check, payload=payload)
 
-        return inner
+    def _check(self, ctx, payload):
+        if payload.message_id != self.page.id:
+            return False
+        elif payload.user_id != ctx.author.id or payload.user_id == ctx.bot.user.id:
+            return False
+        elif self.get_emoji_as_string(payload.emoji) not in self._button_keys:
+            return False
+        return True
 
 
 class Paginator(Session):
@@ -229,17 +288,21 @@ class Paginator(Session):
                  color: Union[int, discord.Colour] = discord.Embed.Empty, use_defaults: bool = True, embed: bool = True,
                  joiner: str = '\n', timeout: int = 180, thumbnail: str = None):
         super().__init__()
-        self._defaults = {(0, '⏮'): Button(emoji='⏮', position=0, callback=partial(self._default_indexer, 'start')),
-                          (1, '◀'): Button(emoji='◀', position=1, callback=partial(self._default_indexer, -1)),
-                          (2, '⏹'): Button(emoji='⏹', position=2, callback=partial(self._default_indexer, 'stop')),
-                          (3, '▶'): Button(emoji='▶', position=3, callback=partial(self._default_indexer, +1)),
-                          (4, '⏭'): Button(emoji='⏭', position=4, callback=partial(self._default_indexer, 'end'))}
-        self._default_stop = {(0, '⏹'): Button(emoji='⏹', position=0, callback=partial(self._default_indexer, 'stop'))}
+        self._defaults = {(0, '⏮'): Button(emoji='⏮', position=0, callback=partial(self._default_indexer, _START)),
+                          (1, '◀'): Button(emoji='◀', position=1, callback=partial(self._default_indexer, _BACK)),
+                          (2, '⏹'): Button(emoji='⏹', position=2, callback=partial(self._default_indexer, _STOP)),
+                          (3, '▶'): Button(emoji='▶', position=3, callback=partial(self._default_indexer, _FORWARD)),
+                          (4, '⏭'): Button(emoji='⏭', position=4, callback=partial(self._default_indexer, _END))}
+        self._default_stop = {(0, '⏹'): Button(emoji='⏹', position=0, callback=partial(self._default_indexer, _STOP))}
+        self._default_buttons = frozenset(self._defaults.values())
+        self._default_stop_buttons = frozenset(self._default_stop.values())
 
         self.buttons = {}
 
         self.page: discord.Message = None
         self._pages = []
+        self._page_is_embed = bytearray()
+        self._last_sent_page = None
         self._session_task = None
         self._cancelled = False
         self._index = 0
@@ -259,14 +322,30 @@ class Paginator(Session):
         self.use_defaults = use_defaults
         self.use_embed = embed
 
-    def chunker(self):
+    @property
+    def format(self):
+        """The first half of the format string to wrap around our entries."""
+        return self._format
+
+    @format.setter
+    def format(self, value: str):
+        self._format = value
+        self._format_rev = value[::-1]
+
+    def chunker(self, *, entries: list = None):
         """Create chunks of our entries for pagination."""
-        for x in range(0, len(self.entries), self.length):
-            yield self.entries[x:x + self.length]
+        if entries is None:
+            entries = list(self.entries or ())
+
+        for x in range(0, len(entries), self.length):
+            yield entries[x:x + self.length]
 
     def formatting(self, entry: str):
         """Format our entries, with the given options."""
-        return f'{self.prefix}{self.format}{entry}{self.format[::-1]}{self.suffix}'
+        if not (self.prefix or self.suffix or self._format):
+            return format(entry)
+
+        return f'{self.prefix}{self.format}{entry}{self._format_rev}{self.suffix}'
 
     async def start(self, ctx: commands.Context, page=None):
         """Start our Paginator session."""
@@ -280,68 +359,76 @@ class Paginator(Session):
         if not self.entries and not self.extra_pages:
             raise AttributeError('You must provide atleast one entry or page for pagination.')  # ^^
 
-        if self.entries:
-            self.entries = [self.formatting(entry) for entry in self.entries]
-            entries = list(self.chunker())
-        else:
-            entries = []
+        entries = list(self.entries or ())
+        self._pages = [None] * math.ceil(len(entries) / self.length)
+
+        for index, chunk in enumerate(self.chunker(entries=entries)):
+            content = self.joiner.join(self.formatting(entry) for entry in chunk)
 
-        for chunk in entries:
             if not self.use_embed:
-                self._pages.append(self.joiner.join(chunk))
+                self._pages[index] = content
             else:
-                embed = discord.Embed(title=self.title, description=self.joiner.join(chunk), colour=self.colour)
+                embed = discord.Embed(title=self.title, description=content, colour=self.colour)
 
                 if self.thumbnail:
                     embed.set_thumbnail(url=self.thumbnail)
 
-                self._pages.append(embed)
+                self._pages[index] = embed
 
-        self._pages = self._pages + self.extra_pages
+        self._pages.extend(self.extra_pages)
+        self._page_is_embed = bytearray(isinstance(page, discord.Embed) for page in self._pages)
 
-        if isinstance(self._pages[0], discord.Embed):
+        if self._page_is_embed[0]:
             self.page = await ctx.send(embed=self._pages[0])
         else:
             self.page = await ctx.send(self._pages[0])
 
-        self._session_task = ctx.bot.loop.create_task(self._session(ctx))
+        self._last_sent_page = self._pages[0]
+
+        self._session_task = asyncio.ensure_future(self._session(ctx))
 
     async def _session(self, ctx):
-        if self.use_defaults:
-            if len(self._pages) == 1:
-                self._buttons = {**self._default_stop, **self._buttons}
-            else:
-                self._buttons = {**self._defaults, **self._buttons}
+        if not self.use_defaults:
+            self.buttons = self.sort_buttons()
+        elif len(self._pages) == 1:
+            self.buttons = self.sort_buttons(buttons={**self._default_stop, **self._buttons})
+        else:
+            self.buttons = self.sort_buttons(buttons={**self._defaults, **self._buttons})
 
-        self.buttons = self.sort_buttons()
+        self._button_keys = frozenset(self.buttons)
 
-        ctx.bot.loop.create_task(self._add_reactions(self.buttons))
+        self._reaction_task = asyncio.ensure_future(self._add_reactions(self.buttons.keys()))
 
         await self._session_loop(ctx)
 
     async def _default_indexer(self, control, ctx, member):
         previous = self._index
 
-        if control == 'stop':
+        if control == _STOP:
             return await self.cancel()
 
-        if control == 'end':
+        if control == _FORWARD:
+            self._index += 1
+        elif control == _BACK:
+            self._index -= 1
+        elif control == _END:
             self._index = len(self._pages) - 1
-        elif control == 'start':
+        elif control == _START:
             self._index = 0
-        else:
-            self._index += control
 
         if self._index > len(self._pages) - 1 or self._index < 0:
             self._index = previous
 
-        if self._index == previous:
+        page = self._pages[self._index]
+        if page is self._last_sent_page:
             return
 
-        if isinstance(self._pages[self._index], discord.Embed):
-            await self.page.edit(embed=self._pages[self._index])
+        if self._page_is_embed[self._index]:
+            await self.page.edit(embed=page)
         else:
-            await self.page.edit(content=self._pages[self._index])
+            await self.page.edit(content=page)
+
+        self._last_sent_page = page
 
 
 def button(emoji: str, *, try_remove=True, position: int = 666):
@@ -365,13 +452,15 @@ def button(emoji: str, *, try_remove=True, position: int = 666):
         if not asyncio.iscoroutinefunction(func):
             raise TypeError('Button callback must be a coroutine.')
 
-        if hasattr(func, '__button__'):
+        if getattr(func, '__is_button__', False):
             button = func.__button__
             button._callback = func
 
             return func
 
         func.__button__ = Button(emoji=emoji, callback=func, position=position, try_remove=try_remove)
+        func.__is_button__ = True
+
         return func
 
     return deco
@@ -400,13 +489,15 @@ def inverse_button(emoji: str = None, *, try_remove=False, position: int = 666):
         if not asyncio.iscoroutinefunction(func):
             raise TypeError('Button callback must be a coroutine.')
 
-        if hasattr(func, '__button__'):
+        if getattr(func, '__is_button__', False):
             button = func.__button__
             button._inverse_callback = func
 
             return func
 
         func.__button__ = Button(emoji=emoji, inverse_callback=func, position=position, try_remove=try_remove)
+        func.__is_button__ = True
+
         return func
 
     return deco